@@ -8,22 +8,6 @@ from polars import DataFrame, Series
 from geopolars.internals.geodataframe import GeoDataFrame
 from geopolars.internals.geoseries import GeoSeries
 
-try:
-    import geopandas
-except ImportError:
-    geopandas = None
-
-try:
-    import pyarrow
-except ImportError:
-    pyarrow = None
-
-try:
-    import shapely
-except ImportError:
-    shapely = None
-
-
 if TYPE_CHECKING:  # pragma: no cover
     import geopandas
     import pandas
@@ -48,7 +32,7 @@ def from_arrow(a: pa.Table | pa.Array | pa.ChunkedArray) -> GeoDataFrame | GeoSe
     # And return a bare Series/DataFrame if it isn't?
     output = pl.from_arrow(a)
     if isinstance(output, Series):
-        return GeoSeries(output)
+        return GeoSeries._from_pl_series(output)
 
     assert isinstance(
         output, DataFrame
@@ -80,7 +64,11 @@ def from_geopandas(
 
         A GeoPolars `GeoDataFrame` or `GeoSeries`
     """
-    if geopandas is None:
+    # Deferred so that importing geopolars stays cheap when geopandas interop
+    # is never used.
+    try:
+        import geopandas
+    except ImportError:
         raise ImportError("Geopandas is required when using from_geopandas().")
 
     import pandas
@@ -0,0 +1,56 @@
+"""Optional Numba-accelerated kernels.
+
+Numba is not a dependency of geopolars; when it isn't installed, callers fall
+back to the pure-NumPy implementations in `geopolars.internals._wkb`.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable
+
+import numpy as np
+
+from geopolars.internals._wkb import MEAN_EARTH_RADIUS
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+haversine_feature_lengths: Callable[[np.ndarray, np.ndarray], np.ndarray] | None = None
+"""Parallel haversine lengths over a flat coordinate buffer, or None when
+numba is not installed.
+
+Same contract as `geopolars.internals._wkb.haversine_lengths`, but
+parallelized across features with SIMD-lowered trig in the inner loop.
+"""
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_feature_lengths(coords, feature_offsets):  # pragma: no cover
+        n = len(feature_offsets) - 1
+        out = np.zeros(n, dtype=np.float64)
+        for i in numba.prange(n):
+            total = 0.0
+            for j in range(feature_offsets[i], feature_offsets[i + 1] - 1):
+                lon1 = math.radians(coords[j, 0])
+                lat1 = math.radians(coords[j, 1])
+                lon2 = math.radians(coords[j + 1, 0])
+                lat2 = math.radians(coords[j + 1, 1])
+                a = (
+                    math.sin((lat2 - lat1) / 2) ** 2
+                    + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+                )
+                total += 2.0 * MEAN_EARTH_RADIUS * math.asin(math.sqrt(a))
+            out[i] = total
+        return out
+
+    def _haversine_feature_lengths_numba(coords, feature_offsets) -> np.ndarray:
+        return _haversine_feature_lengths(
+            np.ascontiguousarray(coords), np.asarray(feature_offsets, dtype=np.int64)
+        )
+
+    haversine_feature_lengths = _haversine_feature_lengths_numba
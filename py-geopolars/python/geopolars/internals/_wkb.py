@@ -0,0 +1,251 @@
+"""Vectorized helpers for peeking into WKB-encoded geometry columns.
+
+These operate directly on the Arrow buffers of a binary series, so cheap
+questions (such as the geometry type of every row) can be answered from the
+fixed-size WKB headers without parsing whole records. Anything these helpers
+can't answer falls back to the Rust core.
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple
+
+import numpy as np
+
+# WKB geometry type codes, after stripping EWKB flag bits and the ISO
+# dimensionality offset.
+WKB_POINT = 1
+WKB_LINESTRING = 2
+WKB_POLYGON = 3
+WKB_MULTIPOINT = 4
+WKB_MULTILINESTRING = 5
+WKB_MULTIPOLYGON = 6
+WKB_GEOMETRYCOLLECTION = 7
+
+_WKB_TYPE_NAMES = {
+    WKB_POINT: "Point",
+    WKB_LINESTRING: "LineString",
+    WKB_POLYGON: "Polygon",
+    WKB_MULTIPOINT: "MultiPoint",
+    WKB_MULTILINESTRING: "MultiLineString",
+    WKB_MULTIPOLYGON: "MultiPolygon",
+    WKB_GEOMETRYCOLLECTION: "GeometryCollection",
+}
+
+# Label table indexed directly by base type code, so a whole column of codes
+# maps to labels with one NumPy gather instead of a per-row dict lookup.
+# Index 0 is unused by well-formed WKB and doubles as the out-of-range slot.
+_GEOM_TYPE_LABELS = np.array(
+    ["Unknown"] + [_WKB_TYPE_NAMES[code] for code in range(1, 8)],
+    dtype=object,
+)
+
+# EWKB stores Z/M/SRID presence in the high bits of the type code.
+_EWKB_FLAG_MASK = 0x1FFFFFFF
+
+# Mean earth radius in meters, matching the constant used by georust's
+# haversine implementation so both paths agree.
+MEAN_EARTH_RADIUS = 6_371_008.8
+
+
+def _binary_buffers(pyarrow_array):
+    """Return ``(values, offsets)`` NumPy views over a pyarrow binary array.
+
+    Returns ``None`` when the array contains nulls or isn't a (large) binary
+    array, in which case callers should fall back to the Rust core.
+    """
+    import pyarrow
+
+    if pyarrow_array.null_count != 0:
+        return None
+
+    if pyarrow_array.type == pyarrow.binary():
+        offset_dtype = np.int32
+    elif pyarrow_array.type == pyarrow.large_binary():
+        offset_dtype = np.int64
+    else:
+        return None
+
+    _validity, offsets_buffer, data_buffer = pyarrow_array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_dtype)[
+        pyarrow_array.offset : pyarrow_array.offset + len(pyarrow_array) + 1
+    ]
+    values = np.frombuffer(data_buffer, dtype=np.uint8)
+    return values, offsets
+
+
+def wkb_type_codes(pyarrow_array) -> np.ndarray | None:
+    """Decode the 5-byte WKB header of every row in one vectorized pass.
+
+    Only the byte-order flag plus the uint32 type code of each record is
+    touched, so the scan reads 5 bytes per geometry regardless of payload
+    size. Returns an array of type codes (see the ``WKB_*`` constants), or
+    ``None`` when the column can't be handled here.
+    """
+    buffers = _binary_buffers(pyarrow_array)
+    if buffers is None:
+        return None
+    values, offsets = buffers
+
+    if len(offsets) <= 1:
+        return np.empty(0, dtype=np.uint32)
+
+    # Every record needs at least the byte-order flag and the type code.
+    if np.any(np.diff(offsets) < 5):
+        return None
+
+    starts = offsets[:-1].astype(np.int64)
+    byte_order = values[starts]
+    b1 = values[starts + 1].astype(np.uint32)
+    b2 = values[starts + 2].astype(np.uint32)
+    b3 = values[starts + 3].astype(np.uint32)
+    b4 = values[starts + 4].astype(np.uint32)
+    little = b1 | (b2 << 8) | (b3 << 16) | (b4 << 24)
+    big = (b1 << 24) | (b2 << 16) | (b3 << 8) | b4
+    codes = np.where(byte_order == 1, little, big)
+
+    # Strip EWKB flag bits, then the ISO offset (Z = base + 1000,
+    # M = base + 2000, ZM = base + 3000) to get the base type.
+    return (codes & _EWKB_FLAG_MASK) % 1000
+
+
+def wkb_type_labels(codes: np.ndarray) -> np.ndarray:
+    """Map an array of base WKB type codes to their string labels.
+
+    Codes outside the known range come back as ``"Unknown"``. One fancy-index
+    gather; no per-row Python dispatch.
+    """
+    return _GEOM_TYPE_LABELS[np.where(codes < len(_GEOM_TYPE_LABELS), codes, 0)]
+
+
+def wkb_object_array(pyarrow_array) -> np.ndarray | None:
+    """Materialize a WKB column as an object array of ``bytes``.
+
+    The values buffer is copied out once as a single Python ``bytes`` object
+    and every record becomes a C-level slice of it, instead of a NumPy scalar
+    roundtrip per geometry. Returns ``None`` when the column isn't a plain
+    (large) binary array.
+    """
+    buffers = _binary_buffers(pyarrow_array)
+    if buffers is None:
+        return None
+    values, offsets = buffers
+
+    data = values.tobytes()
+    out = np.empty(len(offsets) - 1, dtype=object)
+    for i in range(len(out)):
+        out[i] = data[offsets[i] : offsets[i + 1]]
+    return out
+
+
+class ParsedGeoSeries(NamedTuple):
+    """Structure-of-arrays view of a homogeneous WKB column.
+
+    One flat coordinate buffer shared by every op that needs it — parse once,
+    compute many. ``feature_offsets`` is ``None`` for Point columns, where
+    each feature is exactly one row of ``coords``.
+    """
+
+    type_code: int
+    coords: np.ndarray
+    feature_offsets: np.ndarray | None
+
+
+def parse_wkb(pyarrow_array) -> ParsedGeoSeries | None:
+    """Batch-parse a homogeneous WKB column into flat float64 coordinates.
+
+    Only plain little-endian 2D Points and LineStrings are handled; mixed
+    columns and Z/M/SRID variants have a different record layout and stay
+    with the Rust core. Returns ``None`` when the fast path does not apply.
+    """
+    buffers = _binary_buffers(pyarrow_array)
+    if buffers is None:
+        return None
+    values, offsets = buffers
+
+    if len(offsets) <= 1:
+        return None
+
+    starts = offsets[:-1].astype(np.int64)
+    byte_lengths = np.diff(offsets).astype(np.int64)
+    if np.any(byte_lengths < 5) or np.any(values[starts] != 1):
+        return None
+
+    # The raw (unmasked) type code must be the same base type everywhere.
+    raw_codes = (
+        values[starts + 1].astype(np.uint32)
+        | (values[starts + 2].astype(np.uint32) << 8)
+        | (values[starts + 3].astype(np.uint32) << 16)
+        | (values[starts + 4].astype(np.uint32) << 24)
+    )
+
+    if np.all(raw_codes == WKB_POINT):
+        # Fixed-size records: header plus one coordinate pair.
+        if np.any(byte_lengths != 21):
+            return None
+        raw_coords = values[starts[:, None] + 5 + np.arange(16)]
+        coords = raw_coords.view("<f8").reshape(-1, 2)
+        return ParsedGeoSeries(WKB_POINT, coords, None)
+
+    if np.all(raw_codes == WKB_LINESTRING):
+        if np.any(byte_lengths < 9):
+            return None
+        num_points = (
+            values[starts + 5].astype(np.int64)
+            | (values[starts + 6].astype(np.int64) << 8)
+            | (values[starts + 7].astype(np.int64) << 16)
+            | (values[starts + 8].astype(np.int64) << 24)
+        )
+        if np.any(byte_lengths != 9 + 16 * num_points) or np.any(num_points < 2):
+            return None
+
+        total_points = int(num_points.sum())
+        feature_offsets = np.empty(len(num_points) + 1, dtype=np.int64)
+        feature_offsets[0] = 0
+        np.cumsum(num_points, out=feature_offsets[1:])
+
+        # Byte position of every coordinate pair: the feature's first point
+        # is at start + 9, subsequent points are 16 bytes apart.
+        first_point = np.repeat(feature_offsets[:-1], num_points)
+        point_starts = np.repeat(starts + 9, num_points) + 16 * (
+            np.arange(total_points) - first_point
+        )
+        raw_coords = values[point_starts[:, None] + np.arange(16)]
+        coords = raw_coords.view("<f8").reshape(-1, 2)
+        return ParsedGeoSeries(WKB_LINESTRING, coords, feature_offsets)
+
+    return None
+
+
+def linestring_coords(pyarrow_array):
+    """Extract flat ``(n_points, 2)`` coordinates plus per-feature offsets
+    from an all-LineString WKB column.
+
+    Thin wrapper over [`parse_wkb`][geopolars.internals._wkb.parse_wkb] that
+    returns ``(coords, feature_offsets)``, or ``None`` when the column isn't
+    all LineStrings.
+    """
+    parsed = parse_wkb(pyarrow_array)
+    if parsed is None or parsed.type_code != WKB_LINESTRING:
+        return None
+    return parsed.coords, parsed.feature_offsets
+
+
+def haversine_lengths(coords, feature_offsets) -> np.ndarray:
+    """Per-feature haversine lengths over a flat coordinate buffer, in meters.
+
+    All segment lengths are computed in one ufunc chain over the whole buffer;
+    the segments that would join the last point of one feature to the first
+    point of the next are zeroed before the per-feature reduction.
+    """
+    lon = np.deg2rad(coords[:, 0])
+    lat = np.deg2rad(coords[:, 1])
+    dlat = np.diff(lat)
+    dlon = np.diff(lon)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+    )
+    segments = 2 * MEAN_EARTH_RADIUS * np.arcsin(np.sqrt(a))
+    segments[feature_offsets[1:-1] - 1] = 0.0
+    return np.add.reduceat(segments, feature_offsets[:-1])
@@ -4,16 +4,12 @@ import polars as pl
 
 from geopolars.internals.geoseries import GeoSeries
 
-try:
-    import geopandas
-except ImportError:
-    geopandas = None
-
 DEFAULT_GEO_COLUMN_NAME = "geometry"
 
 
 class GeoDataFrame(pl.DataFrame):
     _geometry_column_name = DEFAULT_GEO_COLUMN_NAME
+    _crs = None
 
     def __init__(
         self, data=None, columns=None, orient=None, *, geometry=None  # noqa ARG002
@@ -56,26 +52,55 @@ class GeoDataFrame(pl.DataFrame):
         """
         series = super().get_column(name)
         if name == self._geometry_column_name:
-            series = GeoSeries(series)
+            series = GeoSeries._from_pl_series(series, _crs=self._crs)
 
         return series
 
     @property
     def geometry(self):
-        return GeoSeries(self.get_column(self._geometry_column_name))
+        return self.get_column(self._geometry_column_name)
+
+    @property
+    def crs(self):
+        """The coordinate reference system of the geometry column, if known.
+
+        Carried through conversions from geopandas; geopolars itself does not
+        yet interpret it.
+        """
+        return self._crs
 
     @classmethod
-    def _from_geopandas(cls, geodataframe, force_wkb: bool):  # noqa ARG003
-        # TODO: implement for geoarrow struct
+    def _from_geopandas(cls, geodataframe, force_wkb: bool, schema=None):
+        # `schema` optionally maps column names to polars dtypes; when the
+        # caller already knows the resulting schema (e.g. repeated conversions
+        # of the same source) this skips polars' type-inference pass. Extra
+        # keys, including the geometry column, are ignored.
+        if not force_wkb:
+            # Geoarrow transfer: attribute columns go through the usual
+            # pandas bridge, the geometry column through the ragged-array
+            # coordinate buffers with no WKB encode/decode in between.
+            geometry_name = geodataframe.geometry.name
+            attributes = pl.from_pandas(
+                geodataframe.drop(columns=[geometry_name]), schema_overrides=schema
+            )
+            geometry = GeoSeries._from_geopandas(geodataframe.geometry, force_wkb=False)
+            gdf = cls(attributes.hstack([geometry]))
+            gdf._crs = geodataframe.crs
+            return gdf
+
         from geopandas.io.arrow import _geopandas_to_arrow
 
         arrow_table = _geopandas_to_arrow(geodataframe)
         polars_df = pl.from_arrow(arrow_table)
-        return cls(polars_df)
+        gdf = cls(polars_df)
+        gdf._crs = geodataframe.crs
+        return gdf
 
     def to_geopandas(self):
-        if geopandas is None:
-            raise ImportError("Geopandas is required when using from_geopandas().")
+        try:
+            import geopandas
+        except ImportError:
+            raise ImportError("Geopandas is required when using to_geopandas().")
 
         pandas_df = self.select(
             [col for col in self.columns if col != self._geometry_column_name]
@@ -1,24 +1,201 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from enum import IntEnum
+from typing import TYPE_CHECKING, cast
 
 import polars
 import polars as pl
 
 from geopolars._geopolars import geo as georust
+from geopolars.internals._wkb import (
+    WKB_LINESTRING,
+    WKB_POINT,
+    haversine_lengths,
+    parse_wkb,
+    wkb_type_codes,
+    wkb_type_labels,
+)
 from geopolars.internals.types import AffineTransform, GeodesicMethod, TransformOrigin
 
 if TYPE_CHECKING:
     from geopolars import GeoSeries
 
 
+class _GeodesicMethod(IntEnum):
+    """Integer codes for geodesic length methods.
+
+    These are resolved once at the Python boundary so the Rust core dispatches
+    on a single integer instead of re-parsing a string on every call.
+    """
+
+    GEODESIC = 0
+    HAVERSINE = 1
+    VINCENTY = 2
+
+
+_GEODESIC_METHOD_CODES = {
+    "geodesic": _GeodesicMethod.GEODESIC,
+    "haversine": _GeodesicMethod.HAVERSINE,
+    "vincenty": _GeodesicMethod.VINCENTY,
+}
+
+_UNRESOLVED = object()
+_numba_haversine_lengths = _UNRESOLVED
+
+
+def _haversine_kernel():
+    # Importing _kernels pulls in numba/llvmlite when installed, which costs
+    # hundreds of milliseconds; resolve it on the first haversine call so
+    # `import geopolars` stays cheap. Returns None when numba is absent.
+    global _numba_haversine_lengths
+    if _numba_haversine_lengths is _UNRESOLVED:
+        from geopolars.internals._kernels import haversine_feature_lengths
+
+        _numba_haversine_lengths = haversine_feature_lengths
+    return _numba_haversine_lengths
+
+
+# Affine matrices (in the `[a, b, d, e, xoff, yoff]` convention of
+# affine_transform) for rotate/scale/skew about a fixed coordinate origin.
+# With an explicit (x, y) origin these operations are just one affine pass,
+# so they can share the single affine kernel instead of per-op entrypoints
+# that re-resolve the origin per geometry.
+
+
+def _rotation_matrix(angle: float, ox: float, oy: float) -> AffineTransform:
+    cos = math.cos(math.radians(angle))
+    sin = math.sin(math.radians(angle))
+    return (
+        cos,
+        -sin,
+        sin,
+        cos,
+        ox - ox * cos + oy * sin,
+        oy - ox * sin - oy * cos,
+    )
+
+
+def _scale_matrix(xfact: float, yfact: float, ox: float, oy: float) -> AffineTransform:
+    return (xfact, 0.0, 0.0, yfact, ox * (1 - xfact), oy * (1 - yfact))
+
+
+def _skew_matrix(xs: float, ys: float, ox: float, oy: float) -> AffineTransform:
+    tan_x = math.tan(math.radians(xs))
+    tan_y = math.tan(math.radians(ys))
+    return (1.0, tan_x, tan_y, 1.0, -oy * tan_x, -ox * tan_y)
+
+
+class AffineChain:
+    """Composes a sequence of affine operations into one matrix.
+
+    Chaining ``rotate().translate()...`` as separate calls reads and writes
+    the whole coordinate buffer once per op; since affine composition is
+    associative, the chain folds into a single six-float matrix in Python and
+    the data is touched exactly once on
+    [`apply`][geopolars.internals.georust.geoseries.AffineChain.apply].
+
+    ```py
+    >>> series.geo.affine_chain().rotate(90, origin=(1, 1)).translate(2, 0).apply()
+    ```
+
+    Origins here must be explicit ``(x, y)`` coordinates; the ``'center'`` and
+    ``'centroid'`` keywords depend on each geometry and can't be precomposed.
+    """
+
+    def __init__(self, geoseries: GeoRustSeries):
+        self._geoseries = geoseries
+        self._matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+    def _compose(self, matrix: tuple[float, ...]) -> AffineChain:
+        a1, b1, d1, e1, x1, y1 = self._matrix
+        a2, b2, d2, e2, x2, y2 = matrix
+        self._matrix = (
+            a2 * a1 + b2 * d1,
+            a2 * b1 + b2 * e1,
+            d2 * a1 + e2 * d1,
+            d2 * b1 + e2 * e1,
+            a2 * x1 + b2 * y1 + x2,
+            d2 * x1 + e2 * y1 + y2,
+        )
+        return self
+
+    def translate(self, xoff: float = 0.0, yoff: float = 0.0) -> AffineChain:
+        return self._compose((1.0, 0.0, 0.0, 1.0, xoff, yoff))
+
+    def rotate(
+        self, angle: float, origin: tuple[float, float] = (0.0, 0.0)
+    ) -> AffineChain:
+        ox, oy = origin
+        return self._compose(_rotation_matrix(angle, ox, oy))
+
+    def scale(
+        self,
+        xfact: float = 1.0,
+        yfact: float = 1.0,
+        origin: tuple[float, float] = (0.0, 0.0),
+    ) -> AffineChain:
+        ox, oy = origin
+        return self._compose(_scale_matrix(xfact, yfact, ox, oy))
+
+    def skew(
+        self,
+        xs: float = 0.0,
+        ys: float = 0.0,
+        origin: tuple[float, float] = (0.0, 0.0),
+    ) -> AffineChain:
+        ox, oy = origin
+        return self._compose(_skew_matrix(xs, ys, ox, oy))
+
+    def apply(self) -> GeoSeries:
+        """Apply the composed transform in a single pass over the data."""
+        return self._geoseries.affine_transform(self._matrix)
+
+
 @dataclass
 class GeoRustSeries:
     """Operations to be done via GeoRust native algorithms"""
 
     series: pl.Series
 
+    def _series_fingerprint(self):
+        # Cheap identity for the series' current buffers: append changes
+        # length and chunk count, and swapping the underlying chunks moves
+        # the buffer address. get_ptr is unavailable for multi-chunk or
+        # nested series; fall back to length/chunk count alone there.
+        pyseries = self.series._s
+        try:
+            ptr = pyseries.get_ptr()
+        except Exception:
+            ptr = None
+        return (len(self.series), pyseries.n_chunks(), ptr)
+
+    def _cached_op(self, name: str, compute):
+        # Results of pure ops are memoized on the wrapped series itself, so
+        # the cache dies with the series. Series can still mutate in place
+        # (append, set_at_idx), so the cache carries a buffer fingerprint
+        # and is dropped wholesale when it no longer matches.
+        fingerprint = self._series_fingerprint()
+        cache = getattr(self.series, "_geo_op_cache", None)
+        if cache is None or cache.get("__fingerprint__") != fingerprint:
+            cache = {"__fingerprint__": fingerprint}
+            self.series._geo_op_cache = cache  # type: ignore[attr-defined]
+        if name not in cache:
+            cache[name] = compute()
+        result = cache[name]
+        if isinstance(result, pl.Series):
+            # clone() shares buffers; it only protects the cached entry from
+            # a caller mutating the returned series in place.
+            return result.clone()
+        return result
+
+    def _parsed_wkb(self):
+        # The SoA coordinate buffer is shared between ops (geodesic_length,
+        # x, y, ...), so it's parsed out of the WKB records at most once per
+        # series.
+        return self._cached_op("wkb_soa", lambda: parse_wkb(self.series.to_arrow()))
+
     def affine_transform(self, matrix: list[float] | AffineTransform) -> GeoSeries:
         """Returns a `GeoSeries` with translated geometries.
 
@@ -38,7 +215,22 @@ class GeoRustSeries:
         """
         # TODO: check if transform is an instance of Affine? Or add a test?
         # Since Affine is a namedtuple, will it *just work*?
-        return georust.affine_transform(self, matrix)
+        mat = tuple(matrix)
+        if mat == (1, 0, 0, 1, 0, 0):
+            # Identity: nothing to do, skip the pass over the data entirely.
+            # The wrapped series is the GeoSeries the accessor was built from.
+            return cast("GeoSeries", self.series)
+        if mat[:4] == (1, 0, 0, 1):
+            # Pure translation: two adds per coordinate instead of the
+            # generic six-term kernel.
+            return self.translate(mat[4], mat[5])
+        return georust.affine_transform(self, mat)
+
+    def affine_chain(self) -> AffineChain:
+        """Start an [`AffineChain`][geopolars.internals.georust.geoseries.AffineChain]
+        that folds several affine operations into one pass over the data.
+        """
+        return AffineChain(self)
 
     @property
     def area(self) -> pl.Series:
@@ -58,7 +250,7 @@ class GeoRustSeries:
         [`to_crs`][geopolars.GeoSeries.to_crs] to project geometries to a planar CRS
         before using this function.
         """
-        return georust.area(self)
+        return self._cached_op("area", lambda: georust.area(self))
 
     @property
     def centroid(self) -> GeoSeries:
@@ -71,7 +263,26 @@ class GeoRustSeries:
 
             New `GeoSeries` with centroids.
         """
-        return georust.centroid(self)
+        return self._cached_op("centroid", lambda: georust.centroid(self))
+
+    def compute(self, *ops: str) -> dict[str, pl.Series]:
+        """Evaluate several operations with one crossing into the Rust core.
+
+        The series is converted across the Arrow FFI boundary once and shared
+        by all requested operations, instead of once per op as with the
+        individual wrappers.
+
+        Parameters:
+
+            ops: Names of the operations to evaluate. Supported ops are
+                `'area'`, `'centroid'`, `'convex_hull'`, `'envelope'`,
+                `'euclidean_length'` and `'exterior'`.
+
+        Returns:
+
+            Mapping of operation name to its result.
+        """
+        return dict(zip(ops, georust.compute_many(self, list(ops))))
 
     def convex_hull(self) -> GeoSeries:
         """Returns a `GeoSeries` of geometries representing the convex hull
@@ -101,7 +312,7 @@ class GeoRustSeries:
 
         [`convex_hull`][geopolars.GeoRustSeries.convex_hull]: convex hull geometry
         """
-        return georust.envelope(self)
+        return self._cached_op("envelope", lambda: georust.envelope(self))
 
     def euclidean_length(self) -> pl.Series:
         """Returns a `Series` containing the euclidean length of each geometry
@@ -163,14 +374,52 @@ class GeoRustSeries:
         use [`GeoSeries.to_crs`][geopolars.GeoSeries.to_crs] to project geometries to a
         planar CRS before using this function.
         """
-        return georust.geodesic_length(self, method)
+        # Method names are matched case-insensitively, as the Rust core did
+        # when it parsed the string itself.
+        method_name = method.lower()
+
+        # Haversine over LineStrings is four trig ops per segment; for WKB
+        # storage, extract the coordinates once and let NumPy's SIMD ufuncs do
+        # the work. Geodesic (ellipsoidal) and vincenty stay in the Rust core.
+        if method_name == "haversine" and self.series.dtype == pl.Binary:
+            parsed = self._parsed_wkb()
+            if parsed is not None and parsed.type_code == WKB_LINESTRING:
+                numba_kernel = _haversine_kernel()
+                if numba_kernel is not None:
+                    lengths = numba_kernel(parsed.coords, parsed.feature_offsets)
+                else:
+                    lengths = haversine_lengths(parsed.coords, parsed.feature_offsets)
+                return pl.Series(self.series.name, lengths)
+
+        try:
+            method_code = _GEODESIC_METHOD_CODES[method_name]
+        except KeyError:
+            raise ValueError(
+                "Geodesic calculation method not valid. Use one of geodesic, "
+                "haversine or vincenty"
+            ) from None
+
+        return georust.geodesic_length(self, int(method_code))
 
     @property
     def geom_type(self) -> pl.Series:
         """Returns a `Series` of strings specifying the `Geometry Type` of each
         object.
         """
-        return georust.geom_type(self)
+
+        def compute() -> pl.Series:
+            # For WKB storage the geometry type is sitting in the first 5
+            # bytes of every record, so decode the headers in one NumPy pass
+            # instead of handing the whole payload to the Rust core.
+            if self.series.dtype == pl.Binary:
+                codes = wkb_type_codes(self.series.to_arrow())
+                if codes is not None:
+                    labels = wkb_type_labels(codes)
+                    return pl.Series(self.series.name, labels.tolist(), dtype=pl.Utf8)
+
+            return georust.geom_type(self)
+
+        return self._cached_op("geom_type", compute)
 
     def is_empty(self) -> pl.Series:
         """Returns a `Series` of `dtype('bool')` with value `True` for
@@ -203,6 +452,12 @@ class GeoRustSeries:
                 center (default), 'centroid' for the geometry's centroid, or a
                 coordinate tuple (x, y).
         """
+        if isinstance(origin, (tuple, list)):
+            # A fixed origin makes rotation a single precomposed affine, so
+            # the Rust side runs its one affine kernel with no origin
+            # resolution per geometry.
+            ox, oy = origin
+            return self.affine_transform(_rotation_matrix(angle, ox, oy))
         return georust.rotate(self, angle, origin)
 
     def scale(
@@ -227,6 +482,9 @@ class GeoRustSeries:
             box center (default), 'centroid' for the geometry's 2D centroid
             or a coordinate tuple (x, y).
         """
+        if isinstance(origin, (tuple, list)):
+            ox, oy = origin
+            return self.affine_transform(_scale_matrix(xfact, yfact, ox, oy))
         return georust.scale(self, xfact, yfact, origin)
 
     def skew(
@@ -254,6 +512,9 @@ class GeoRustSeries:
             `GeoSeries` with skewed geometries.
         """
 
+        if isinstance(origin, (tuple, list)):
+            ox, oy = origin
+            return self.affine_transform(_skew_matrix(xs, ys, ox, oy))
         return georust.skew(self, xs, ys, origin)
 
     def distance(self, other: GeoSeries) -> GeoSeries:
@@ -303,6 +564,12 @@ class GeoRustSeries:
 
             Series with x values
         """
+        # For an all-Point WKB column the x values sit at a fixed offset of
+        # every record; the shared SoA parse already gathered them.
+        if self.series.dtype == pl.Binary:
+            parsed = self._parsed_wkb()
+            if parsed is not None and parsed.type_code == WKB_POINT:
+                return pl.Series(self.series.name, parsed.coords[:, 0])
         return georust.x(self)
 
     @property
@@ -317,4 +584,8 @@ class GeoRustSeries:
 
             Series with y values
         """
+        if self.series.dtype == pl.Binary:
+            parsed = self._parsed_wkb()
+            if parsed is not None and parsed.type_code == WKB_POINT:
+                return pl.Series(self.series.name, parsed.coords[:, 1])
         return georust.y(self)
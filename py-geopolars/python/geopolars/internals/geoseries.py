@@ -6,37 +6,69 @@ import polars as pl
 
 from geopolars import _geopolars
 from geopolars.enums import GeometryType
+from geopolars.internals._wkb import wkb_object_array
 from geopolars.internals.georust import GeoRustSeries
 from geopolars.internals.geos import GEOSSeriesOperations
 from geopolars.proj import PROJ_DATA_PATH
 
-try:
+if TYPE_CHECKING:
     import geopandas
-except ImportError:
-    geopandas = None
+    import pyarrow
+    import pyproj
+
+# Capability checks resolved once at import time, so `to_crs` does a global
+# load per call instead of an attribute lookup on the extension module.
+_HAS_TO_CRS = hasattr(_geopolars.proj, "to_crs")
+_HAS_PROJ_DATA = bool(PROJ_DATA_PATH)
+# Newer builds of the extension materialize WKB records as bytes at the C
+# level; older builds fall back to the NumPy slicing path.
+_HAS_WKB_BYTES_LIST = hasattr(_geopolars.geo, "wkb_bytes_list")
+
 
-try:
+def _geom_type_from_arrow(pyarrow_type) -> GeometryType | None:
+    """Infer the geometry type from a geoarrow-style Arrow storage type.
+
+    The nesting depth around the x/y coordinate struct determines the type:
+    a bare struct is a Point column, one list level a LineString, two a
+    Polygon. Binary storage means WKB. Returns ``None`` for anything else.
+    """
     import pyarrow
-except ImportError:
-    pyarrow = None
 
-try:
-    import shapely
-except ImportError:
-    shapely = None
+    if pyarrow_type in (pyarrow.binary(), pyarrow.large_binary()):
+        return GeometryType.MISSING
 
-if TYPE_CHECKING:
-    import geopandas
-    import pyproj
+    depth = 0
+    while pyarrow.types.is_list(pyarrow_type) or pyarrow.types.is_large_list(
+        pyarrow_type
+    ):
+        depth += 1
+        pyarrow_type = pyarrow_type.value_type
+    if not pyarrow.types.is_struct(pyarrow_type):
+        return None
+    return {
+        0: GeometryType.POINT,
+        1: GeometryType.LINESTRING,
+        2: GeometryType.POLYGON,
+    }.get(depth)
 
 
 class GeoSeries(pl.Series):
     """Extension of `polars.Series` to handle geospatial vector data."""
 
-    _geom_type: GeometryType | None
-
-    def __init__(self, *args, _geom_type: GeometryType | None = None, **kwargs):
+    # Class-level defaults so series created by inherited polars constructors
+    # (e.g. clone) still answer .crs/._geom_type.
+    _geom_type: GeometryType | None = None
+    _crs = None
+
+    def __init__(
+        self,
+        *args,
+        _geom_type: GeometryType | None = None,
+        _crs=None,
+        **kwargs,
+    ):
         self._geom_type = _geom_type
+        self._crs = _crs
 
         if isinstance(args[0], pl.Series):
             self._s = args[0]._s
@@ -44,6 +76,34 @@ class GeoSeries(pl.Series):
 
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def _from_pl_series(
+        cls,
+        series: pl.Series,
+        _geom_type: GeometryType | None = None,
+        _crs=None,
+    ) -> GeoSeries:
+        """Wrap an existing polars Series without running ``__init__``.
+
+        This is the hot internal constructor: wrapping is just sharing the
+        underlying PySeries pointer, so skip the argument dispatch entirely.
+        """
+        geoseries = object.__new__(cls)
+        geoseries._geom_type = _geom_type
+        geoseries._crs = _crs
+        geoseries._s = series._s
+        return geoseries
+
+    @property
+    def crs(self):
+        """The coordinate reference system of the geometries, if known.
+
+        Carried through conversions from geopandas; geopolars itself does not
+        yet interpret it (pass explicit systems to
+        [`to_crs`][geopolars.GeoSeries.to_crs]).
+        """
+        return self._crs
+
     # TODO: these are named too similarly
     @property
     def geo(self) -> GeoRustSeries:
@@ -55,12 +115,24 @@ class GeoSeries(pl.Series):
 
     @classmethod
     def _from_geopandas(cls, geoseries: geopandas.GeoSeries, force_wkb: bool):
-        if geopandas is None:
+        # Imported here rather than at module level so that `import geopolars`
+        # doesn't pay for geopandas (which pulls in pandas and pyproj) unless a
+        # conversion is actually requested.
+        try:
+            import geopandas  # noqa: F401
+        except ImportError:
             raise ImportError("Geopandas is required when using from_geopandas().")
 
-        if pyarrow is None:
+        try:
+            import pyarrow
+        except ImportError:
             raise ImportError("Pyarrow is required when using from_geopandas().")
 
+        try:
+            import shapely
+        except ImportError:
+            shapely = None
+
         if shapely is None or shapely.__version__[0] != "2":
             raise ImportError(
                 "Shapely version 2 is required when using from_geopandas()."
@@ -68,16 +140,34 @@ class GeoSeries(pl.Series):
 
         import numpy as np
 
+        crs = geoseries.crs
+
         if len(np.unique(shapely.get_type_id(geoseries))) != 1:
             print("Multiple geometry types: falling back to WKB encoding")
             force_wkb = True
 
+        name = geoseries.name or "geometry"
+
         if force_wkb:
-            wkb_arrow_array = pyarrow.Array.from_pandas(geoseries.to_wkb())
-            polars_series = pl.Series._from_arrow(
-                geoseries.name or "geometry", wkb_arrow_array
+            if hasattr(geoseries, "to_arrow"):
+                # geopandas >= 1.0 exports WKB through the Arrow C data
+                # interface directly, skipping the per-geometry bytes
+                # materialization of to_wkb().
+                wkb_arrow_array = pyarrow.array(
+                    geoseries.to_arrow(geometry_encoding="WKB")
+                )
+            else:
+                # shapely's vectorized to_wkb builds the bytes objects in C;
+                # geoseries.to_wkb() would materialize an intermediate pandas
+                # Series and re-copy it element by element.
+                wkb_arrow_array = pyarrow.array(
+                    shapely.to_wkb(np.asarray(geoseries.array)),
+                    type=pyarrow.binary(),
+                )
+            polars_series = pl.Series._from_arrow(name, wkb_arrow_array)
+            return cls._from_pl_series(
+                polars_series, _geom_type=GeometryType.MISSING, _crs=crs
             )
-            return cls(polars_series, _geom_type=GeometryType.MISSING)
 
         geom_type, coords, offsets = shapely.to_ragged_array(geoseries, include_z=False)
 
@@ -87,7 +177,11 @@ class GeoSeries(pl.Series):
             parr = pyarrow.StructArray.from_arrays(
                 [coords[:, 0], coords[:, 1]], ["x", "y"]
             )
-            return cls(parr, _geom_type=GeometryType.POINT)
+            return cls._from_pl_series(
+                pl.Series._from_arrow(name, parr),
+                _geom_type=GeometryType.POINT,
+                _crs=crs,
+            )
 
         elif geom_type == shapely.GeometryType.LINESTRING:
             offsets1 = offsets[0]
@@ -95,7 +189,11 @@ class GeoSeries(pl.Series):
                 [coords[:, 0], coords[:, 1]], ["x", "y"]
             )
             parr = pyarrow.ListArray.from_arrays(pyarrow.array(offsets1), _parr)
-            return cls(parr, _geom_type=GeometryType.LINESTRING)
+            return cls._from_pl_series(
+                pl.Series._from_arrow(name, parr),
+                _geom_type=GeometryType.LINESTRING,
+                _crs=crs,
+            )
 
         elif geom_type == shapely.GeometryType.POLYGON:
             offsets1, offsets2 = offsets
@@ -104,7 +202,11 @@ class GeoSeries(pl.Series):
             )
             _parr1 = pyarrow.ListArray.from_arrays(pyarrow.array(offsets1), _parr)
             parr = pyarrow.ListArray.from_arrays(pyarrow.array(offsets2), _parr1)
-            return cls(parr, _geom_type=GeometryType.POLYGON)
+            return cls._from_pl_series(
+                pl.Series._from_arrow(name, parr),
+                _geom_type=GeometryType.POLYGON,
+                _crs=crs,
+            )
 
         elif geom_type == shapely.GeometryType.MULTIPOINT:
             raise NotImplementedError("Multi types not yet supported")
@@ -149,71 +251,107 @@ class GeoSeries(pl.Series):
 
             This `GeoSeries` as a `geopandas.GeoSeries`.
         """
-        if geopandas is None:
+        try:
+            import geopandas
+        except ImportError:
             raise ImportError("Geopandas is required when using to_geopandas().")
 
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Pyarrow is required when using to_geopandas().")
+
+        try:
+            import shapely
+        except ImportError:
+            raise ImportError("Shapely is required when using to_geopandas().")
+
         import numpy as np
 
         pyarrow_array = self.to_arrow()
-        if not self._geom_type or pyarrow_array.type == pyarrow.binary():
+        # Note: `self._geom_type is None` rather than a truthiness check, since
+        # GeometryType.POINT is 0 and thus falsy. A bare wrap (e.g. a column
+        # pulled out of a GeoDataFrame) has no recorded geometry type, so
+        # recover it from the Arrow type of the storage.
+        geom_type = self._geom_type
+        if geom_type is None:
+            geom_type = _geom_type_from_arrow(pyarrow_array.type)
+        if geom_type in (None, GeometryType.MISSING) or pyarrow_array.type in (
+            pyarrow.binary(),
+            pyarrow.large_binary(),
+        ):
+            if _HAS_WKB_BYTES_LIST:
+                # One PyBytes_FromStringAndSize per record, straight off the
+                # Arrow buffers in the Rust core.
+                wkb_list = _geopolars.geo.wkb_bytes_list(self)
+                return geopandas.GeoSeries(shapely.from_wkb(wkb_list), crs=self._crs)
+
+            wkb_array = wkb_object_array(pyarrow_array)
+            if wkb_array is not None:
+                # One flat values buffer with C-level slices per record, fed
+                # straight to shapely's vectorized from_wkb; skips the
+                # geopandas.array.from_wkb Python wrapper.
+                return geopandas.GeoSeries(shapely.from_wkb(wkb_array), crs=self._crs)
+
             numpy_array = pyarrow_array.to_numpy(zero_copy_only=False)
             # Ideally we shouldn't need the cast to numpy, but the pyarrow BinaryScalar
             # hasn't implemented len()
-            return geopandas.GeoSeries(geopandas.array.from_wkb(numpy_array))
+            return geopandas.GeoSeries(
+                geopandas.array.from_wkb(numpy_array), crs=self._crs
+            )
 
         def geoarrow_coords_to_numpy(struct_array: pyarrow.StructArray):
             x_coords = struct_array.field("x").to_numpy()
             y_coords = struct_array.field("y").to_numpy()
-            return np.vstack([x_coords, y_coords]).T
-
-        # Assume it's a geoarrow column
-        if self._geom_type == GeometryType.POINT:
+            # shapely requires C-contiguous coordinates; a transposed vstack
+            # view would be rejected.
+            return np.column_stack([x_coords, y_coords])
+
+        # Assume it's a geoarrow column; shapely's from_ragged_array consumes
+        # the coordinate and offset buffers directly, with no per-geometry
+        # WKB bytes in between.
+        offsets: tuple[np.ndarray, ...] | None
+        if geom_type == GeometryType.POINT:
+            shapely_type = shapely.GeometryType.POINT
             coords = geoarrow_coords_to_numpy(pyarrow_array)
-            return shapely.from_ragged_array(shapely.GeometryType.POINT, coords, None)
+            offsets = None
 
-        elif self._geom_type == GeometryType.LINESTRING:
-            coords = geoarrow_coords_to_numpy(pyarrow_array.values)
-            offsets = np.asarray(pyarrow_array.offsets)
-            return shapely.from_ragged_array(
-                shapely.GeometryType.LINESTRING, coords, offsets
+        elif geom_type in (GeometryType.LINESTRING, GeometryType.MULTIPOINT):
+            shapely_type = (
+                shapely.GeometryType.LINESTRING
+                if geom_type == GeometryType.LINESTRING
+                else shapely.GeometryType.MULTIPOINT
             )
-
-        elif self._geom_type == GeometryType.POLYGON:
-            coords = geoarrow_coords_to_numpy(pyarrow_array.values.values)
-            offsets2 = np.asarray(pyarrow_array.offsets)
-            offsets1 = np.asarray(pyarrow_array.values.offsets)
-            offsets = (offsets1, offsets2)  # type: ignore
-            return shapely.from_ragged_array(
-                shapely.GeometryType.POLYGON, coords, offsets
-            )
-
-        elif self._geom_type == GeometryType.MULTIPOINT:
             coords = geoarrow_coords_to_numpy(pyarrow_array.values)
-            offsets = np.asarray(pyarrow_array.offsets)
-            return shapely.from_ragged_array(
-                shapely.GeometryType.MULTIPOINT, coords, offsets
-            )
+            offsets = (np.asarray(pyarrow_array.offsets),)
 
-        elif self._geom_type == GeometryType.MULTILINESTRING:
+        elif geom_type in (GeometryType.POLYGON, GeometryType.MULTILINESTRING):
+            shapely_type = (
+                shapely.GeometryType.POLYGON
+                if geom_type == GeometryType.POLYGON
+                else shapely.GeometryType.MULTILINESTRING
+            )
             coords = geoarrow_coords_to_numpy(pyarrow_array.values.values)
-            offsets2 = np.asarray(pyarrow_array.offsets)
-            offsets1 = np.asarray(pyarrow_array.values.offsets)
-            offsets = (offsets1, offsets2)  # type: ignore
-            return shapely.from_ragged_array(
-                shapely.GeometryType.MULTILINESTRING, coords, offsets
+            offsets = (
+                np.asarray(pyarrow_array.values.offsets),
+                np.asarray(pyarrow_array.offsets),
             )
 
-        elif self._geom_type == GeometryType.MULTIPOLYGON:
+        elif geom_type == GeometryType.MULTIPOLYGON:
+            shapely_type = shapely.GeometryType.MULTIPOLYGON
             coords = geoarrow_coords_to_numpy(pyarrow_array.values.values.values)
-            offsets3 = np.asarray(pyarrow_array.offsets)
-            offsets2 = np.asarray(pyarrow_array.values.offsets)
-            offsets1 = np.asarray(pyarrow_array.values.values.offsets)
-            offsets = (offsets1, offsets2, offsets3)  # type: ignore
-            return shapely.from_ragged_array(
-                shapely.GeometryType.MULTIPOLYGON, coords, offsets
+            offsets = (
+                np.asarray(pyarrow_array.values.values.offsets),
+                np.asarray(pyarrow_array.values.offsets),
+                np.asarray(pyarrow_array.offsets),
             )
 
-        raise ValueError()
+        else:
+            raise ValueError()
+
+        return geopandas.GeoSeries(
+            shapely.from_ragged_array(shapely_type, coords, offsets), crs=self._crs
+        )
 
     def to_crs(
         self, from_crs: str | pyproj.crs.CRS, to_crs: str | pyproj.crs.CRS
@@ -246,11 +384,11 @@ class GeoSeries(pl.Series):
                 system.
         """
 
-        if not hasattr(_geopolars.proj, "to_crs"):
+        if not _HAS_TO_CRS:
             # TODO: use a custom geopolars exception class here
             raise ValueError("Geopolars not built with proj support")
 
-        if not PROJ_DATA_PATH:
+        if not _HAS_PROJ_DATA:
             raise ValueError("PROJ_DATA could not be found.")
 
         # If pyproj.CRS objects are passed in, serialize them to PROJJSON
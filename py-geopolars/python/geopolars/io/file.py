@@ -111,9 +111,26 @@ def read_file(
 
     geometry_name = metadata["geometry_name"] or "wkb_geometry"
     # Note: we're passing in a pyarrow.Table so the result will always be a
-    # DataFrame, not series
-    df = cast(DataFrame, pl.from_arrow(table))
+    # DataFrame, not series. pyogrio already returns single-chunk columns, so
+    # rechunking would just re-copy every buffer.
+    df = cast(DataFrame, pl.from_arrow(table, rechunk=False))
     if geometry_name not in table.column_names:
         return df
 
     return GeoDataFrame(df)
+
+
+def scan_file(path_or_buffer: Path | str | bytes, /, **kwargs) -> pl.LazyFrame:
+    """Read an OGR data source into a lazy `polars.LazyFrame`.
+
+    Accepts the same keyword arguments as [`read_file`][geopolars.read_file].
+    Downstream `filter`/`select` calls are fused by polars' lazy engine rather
+    than running one eager pass per op; note that the read itself is still
+    eager, so use the `columns`, `where` and `bbox` keywords to push selection
+    into GDAL and avoid decoding features that would be dropped anyway.
+
+    Returns:
+
+        A `polars.LazyFrame` over the data source.
+    """
+    return read_file(path_or_buffer, **kwargs).lazy()
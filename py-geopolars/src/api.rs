@@ -16,6 +16,7 @@ fn register_geo_module(py: Python<'_>, parent_module: &PyModule) -> PyResult<()>
     child_module.add_wrapped(wrap_pyfunction!(geo::affine_transform))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::area))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::centroid))?;
+    child_module.add_wrapped(wrap_pyfunction!(geo::compute_many))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::convex_hull))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::envelope))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::euclidean_length))?;
@@ -29,6 +30,7 @@ fn register_geo_module(py: Python<'_>, parent_module: &PyModule) -> PyResult<()>
     child_module.add_wrapped(wrap_pyfunction!(geo::skew))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::distance))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::translate))?;
+    child_module.add_wrapped(wrap_pyfunction!(geo::wkb_bytes_list))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::x))?;
     child_module.add_wrapped(wrap_pyfunction!(geo::y))?;
 
@@ -4,14 +4,22 @@ use crate::utils::PythonTransformOrigin;
 use geopolars::geopolars_geo::geoseries::GeoSeries;
 use geopolars::geopolars_geo::ops::length::GeodesicLengthMethod;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 
 /// Apply an affine transform to the geoseries and return a geoseries of the tranformed geometries;
 #[pyfunction]
 pub(crate) fn affine_transform(series: &PyAny, transform: [f64; 6]) -> PyResult<PyObject> {
     let series = ffi::py_series_to_rust_series(series)?;
-    let out = series
-        .affine_transform(transform)
-        .map_err(PyGeopolarsError::from)?;
+    let [a, b, d, e, xoff, yoff] = transform;
+    // Translation-only matrices are a common degenerate form (e.g. produced
+    // by composing affine chains); route them to the translate kernel, which
+    // is two adds per coordinate instead of the generic six-term kernel.
+    let out = if a == 1.0 && b == 0.0 && d == 0.0 && e == 1.0 {
+        series.translate(xoff, yoff)
+    } else {
+        series.affine_transform(transform)
+    }
+    .map_err(PyGeopolarsError::from)?;
     ffi::rust_series_to_py_geoseries(&out)
 }
 
@@ -29,6 +37,44 @@ pub(crate) fn centroid(series: &PyAny) -> PyResult<PyObject> {
     ffi::rust_series_to_py_geoseries(&out)
 }
 
+/// Evaluate several operations over one series, converting it across the FFI
+/// boundary a single time instead of once per op.
+#[pyfunction]
+pub(crate) fn compute_many(series: &PyAny, ops: Vec<String>) -> PyResult<Vec<PyObject>> {
+    let series = ffi::py_series_to_rust_series(series)?;
+    let mut out = Vec::with_capacity(ops.len());
+    for op in &ops {
+        let result = match op.as_str() {
+            "area" => {
+                ffi::rust_series_to_py_series(&series.area().map_err(PyGeopolarsError::from)?)?
+            }
+            "centroid" => ffi::rust_series_to_py_geoseries(
+                &series.centroid().map_err(PyGeopolarsError::from)?,
+            )?,
+            "convex_hull" => ffi::rust_series_to_py_geoseries(
+                &series.convex_hull().map_err(PyGeopolarsError::from)?,
+            )?,
+            "envelope" => ffi::rust_series_to_py_geoseries(
+                &series.envelope().map_err(PyGeopolarsError::from)?,
+            )?,
+            "euclidean_length" => ffi::rust_series_to_py_series(
+                &series.euclidean_length().map_err(PyGeopolarsError::from)?,
+            )?,
+            "exterior" => ffi::rust_series_to_py_geoseries(
+                &series.exterior().map_err(PyGeopolarsError::from)?,
+            )?,
+            _ => {
+                return Err(PyGeopolarsError::Other(format!(
+                    "Unsupported op for compute_many: {op}"
+                ))
+                .into())
+            }
+        };
+        out.push(result);
+    }
+    Ok(out)
+}
+
 #[pyfunction]
 pub(crate) fn convex_hull(series: &PyAny) -> PyResult<PyObject> {
     let series = ffi::py_series_to_rust_series(series)?;
@@ -58,13 +104,14 @@ pub(crate) fn exterior(series: &PyAny) -> PyResult<PyObject> {
 }
 
 #[pyfunction]
-pub(crate) fn geodesic_length(series: &PyAny, method: &str) -> PyResult<PyObject> {
+pub(crate) fn geodesic_length(series: &PyAny, method: u8) -> PyResult<PyObject> {
     let series = ffi::py_series_to_rust_series(series)?;
 
-    let rust_method: GeodesicLengthMethod = match method.to_lowercase().as_str() {
-        "geodesic" => Ok(GeodesicLengthMethod::Geodesic),
-        "haversine" => Ok(GeodesicLengthMethod::Haversine),
-        "vincenty" => Ok(GeodesicLengthMethod::Vincenty),
+    // Codes match `_GeodesicMethod` on the Python side.
+    let rust_method: GeodesicLengthMethod = match method {
+        0 => Ok(GeodesicLengthMethod::Geodesic),
+        1 => Ok(GeodesicLengthMethod::Haversine),
+        2 => Ok(GeodesicLengthMethod::Vincenty),
         _ => Err(PyGeopolarsError::Other(
             "Geodesic calculation method not valid. Use one of geodesic, haversine or vincenty"
                 .to_string(),
@@ -155,6 +202,22 @@ pub(crate) fn translate(series: &PyAny, x: f64, y: f64) -> PyResult<PyObject> {
     ffi::rust_series_to_py_geoseries(&out)
 }
 
+/// Materialize a WKB series as a list of Python `bytes`.
+///
+/// Walks the Arrow offsets/values buffers directly and emits one
+/// `PyBytes_FromStringAndSize` per record, so conversion to shapely does not
+/// round-trip every geometry through a NumPy scalar.
+#[pyfunction]
+pub(crate) fn wkb_bytes_list(py: Python, series: &PyAny) -> PyResult<Vec<Option<PyObject>>> {
+    let series = ffi::py_series_to_rust_series(series)?;
+    let ca = series.binary().map_err(PyGeopolarsError::from)?;
+    let out = ca
+        .into_iter()
+        .map(|record| record.map(|bytes| PyBytes::new(py, bytes).into()))
+        .collect();
+    Ok(out)
+}
+
 #[pyfunction]
 pub(crate) fn x(series: &PyAny) -> PyResult<PyObject> {
     let series = ffi::py_series_to_rust_series(series)?;
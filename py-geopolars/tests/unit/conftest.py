@@ -1,12 +1,65 @@
 from __future__ import annotations
 
+import geopandas
+import geopandas.datasets
+import pyproj
 import pytest
 
 import geopolars as gpl
 
-NE_CITIES_GDF = gpl.datasets.read_dataset("naturalearth_cities")
+# get_path walks the geopandas package data on every call; resolve the
+# bundled dataset location once at collection time.
+_NE_CITIES_PATH = geopandas.datasets.get_path("naturalearth_cities")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _pyproj_warm():
+    # PROJ lazy-opens proj.db on the first CRS operation; force that once
+    # per worker so the cost lands here instead of inside whichever test
+    # happens to touch a CRS first.
+    pyproj.CRS.from_epsg(4326)
+
+
+@pytest.fixture(scope="session")
+def ne_cities_path() -> str:
+    return _NE_CITIES_PATH
+
+
+@pytest.fixture(scope="session")
 def ne_cities_gdf() -> gpl.GeoDataFrame:
-    return NE_CITIES_GDF
+    return gpl.datasets.read_dataset("naturalearth_cities")
+
+
+@pytest.fixture(scope="session")
+def ne_cities_schema(ne_cities_gdf: gpl.GeoDataFrame):
+    # Known output schema of the cities conversions; passing it to
+    # _from_geopandas skips polars' type-inference pass.
+    return ne_cities_gdf.schema
+
+
+@pytest.fixture(scope="session")
+def ne_cities_geoseries(ne_cities_gdf: gpl.GeoDataFrame) -> gpl.GeoSeries:
+    # get_column re-wraps the column on every access; the geometry series is
+    # read-only in tests, so share one wrap.
+    return ne_cities_gdf.geometry
+
+
+@pytest.fixture(scope="session")
+def ne_cities_gdf_as_geopandas(ne_cities_gdf: gpl.GeoDataFrame):
+    # to_geopandas() is an O(N) coordinate copy; tests that only read the
+    # converted frame share one materialization.
+    return ne_cities_gdf.to_geopandas()
+
+
+@pytest.fixture(scope="session")
+def ne_cities_geopandas_gdf() -> geopandas.GeoDataFrame:
+    # Parsing the shapefile (GDAL open + WKB decode + CRS parse) once per
+    # session; the tests only read from it.
+    return geopandas.read_file(_NE_CITIES_PATH)
+
+
+@pytest.fixture(scope="session")
+def ne_cities_crs(ne_cities_geopandas_gdf: geopandas.GeoDataFrame) -> pyproj.CRS:
+    # One parsed CRS object for the whole session; WKT-through-PROJ parsing is
+    # the most expensive non-IO step in the CRS assertions.
+    return pyproj.CRS.from_user_input(ne_cities_geopandas_gdf.crs)
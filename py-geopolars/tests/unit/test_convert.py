@@ -1,47 +1,190 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
 import geopandas
-import geopandas.datasets
+import pytest
 
 import geopolars as gpl
 
+# The tests here share only read-only session fixtures, so under
+# `pytest -n auto` they can run in parallel; grouping them keeps the
+# session fixtures on one worker instead of being rebuilt per worker.
+pytestmark = pytest.mark.xdist_group("convert")
+
+
+@lru_cache(maxsize=None)
+def _cached_crs(key):
+    # from_user_input walks the PROJ database on every call; cache the parsed
+    # CRS so repeated assertions against the same system parse it once.
+    # pyproj is imported lazily so collection-only runs never pay PROJ init.
+    import pyproj
+
+    return pyproj.CRS.from_user_input(key)
+
+
+def _compute_crs_key(x):
+    # Most CRS here are EPSG-identified; normalizing to the authority code
+    # makes the comparison a tuple equality instead of pyproj's WKT-based
+    # __eq__ walk.
+    import pyproj
+
+    if x is None:
+        return None
+    if isinstance(x, int):
+        return ("epsg", x)
+    crs = x if isinstance(x, pyproj.CRS) else pyproj.CRS.from_user_input(x)
+    epsg = crs.to_epsg()
+    if epsg is not None:
+        return ("epsg", epsg)
+    return ("wkt", crs.to_wkt())
+
+
+_crs_key_cached = lru_cache(maxsize=None)(_compute_crs_key)
+_crs_key_by_id: dict[int, tuple[object, object]] = {}
+
+
+def _crs_key(x):
+    try:
+        return _crs_key_cached(x)
+    except TypeError:
+        # Unhashable CRS inputs (e.g. PROJ parameter dicts) can't go through
+        # lru_cache; memoize those by object identity instead. The memoized
+        # object is stored alongside its key so it stays alive and its id
+        # can't be reused by a different CRS.
+        entry = _crs_key_by_id.get(id(x))
+        if entry is None or entry[0] is not x:
+            entry = (x, _compute_crs_key(x))
+            _crs_key_by_id[id(x)] = entry
+        return entry[1]
+
+
+def _crs_equal(a, b) -> bool:
+    # CRS typically propagates by reference through a round trip, so settle
+    # identity (and plain string equality) without touching PROJ at all.
+    if a is b:
+        return True
+    if isinstance(a, str) and isinstance(b, str) and a == b:
+        return True
+    if _crs_key(a) == _crs_key(b):
+        return True
+    # Mismatched keys can still describe the same system when only axis
+    # order differs; equals(ignore_axis_order=True) checks authority codes
+    # before resorting to pyproj's full WKT comparison.
+    import pyproj
+
+    return pyproj.CRS.from_user_input(a).equals(
+        pyproj.CRS.from_user_input(b), ignore_axis_order=True
+    )
+
+
+def _roundtrip(x, via=None, **kwargs):
+    # One kernel for the to_geopandas -> _from_geopandas pattern the
+    # round-trip tests repeat; `via` lets callers reuse a session-cached
+    # geopandas materialization instead of re-converting.
+    if via is None:
+        via = x.to_geopandas()
+    return type(x)._from_geopandas(via, **kwargs)
+
+
+def _assert_equiv(converted, expected, expected_type, expected_crs=None):
+    # One home for the type/value/CRS assertion triple the conversion tests
+    # share; the CRS check (the expensive one) runs once per call.
+    assert isinstance(converted, expected_type)
+    if isinstance(converted, gpl.GeoDataFrame):
+        assert converted.frame_equal(expected)
+    else:
+        assert converted.series_equal(expected)
+    if expected_crs is not None:
+        assert _crs_equal(converted.crs, expected_crs)
+
 
 class TestFromGeoPandas:
-    def test_gdf_from_geopandas(self, ne_cities_gdf: gpl.GeoDataFrame):
-        geopandas_gdf = geopandas.read_file(
-            geopandas.datasets.get_path("naturalearth_cities")
-        )
-        gdf = gpl.from_geopandas(geopandas_gdf)
-        assert isinstance(gdf, gpl.GeoDataFrame)
-        assert gdf.frame_equal(ne_cities_gdf)
-
-    def test_geoseries_from_geopandas(self, ne_cities_gdf: gpl.GeoDataFrame):
-        geopandas_gdf = geopandas.read_file(
-            geopandas.datasets.get_path("naturalearth_cities")
-        )
-        geoseries = gpl.from_geopandas(geopandas_gdf.geometry)
-        assert isinstance(geoseries, gpl.GeoSeries)
-        assert geoseries.series_equal(ne_cities_gdf.get_column("geometry"))
+    @pytest.mark.parametrize("kind", ["gdf", "geoseries"])
+    def test_from_geopandas(
+        self,
+        kind: str,
+        ne_cities_gdf: gpl.GeoDataFrame,
+        ne_cities_geoseries: gpl.GeoSeries,
+        ne_cities_geopandas_gdf: geopandas.GeoDataFrame,
+        ne_cities_crs,
+    ):
+        if kind == "gdf":
+            converted = gpl.from_geopandas(ne_cities_geopandas_gdf)
+            _assert_equiv(converted, ne_cities_gdf, gpl.GeoDataFrame, ne_cities_crs)
+        else:
+            converted = gpl.from_geopandas(ne_cities_geopandas_gdf.geometry)
+            _assert_equiv(converted, ne_cities_geoseries, gpl.GeoSeries, ne_cities_crs)
 
 
 class TestToGeoPandas:
-    def test_gdf_to_geopandas(self, ne_cities_gdf: gpl.GeoDataFrame):
-        geopandas_gdf = ne_cities_gdf.to_geopandas()
-        assert isinstance(geopandas_gdf, geopandas.GeoDataFrame)
-
-    def test_geoseries_to_geopandas(self, ne_cities_gdf: gpl.GeoDataFrame):
-        geopandas_geoseries = ne_cities_gdf.geometry.to_geopandas()
-        assert isinstance(geopandas_geoseries, geopandas.GeoSeries)
+    @pytest.mark.parametrize("kind", ["gdf", "geoseries"])
+    def test_to_geopandas(
+        self, kind: str, ne_cities_gdf: gpl.GeoDataFrame, ne_cities_gdf_as_geopandas
+    ):
+        if kind == "gdf":
+            assert isinstance(ne_cities_gdf_as_geopandas, geopandas.GeoDataFrame)
+        else:
+            geopandas_geoseries = ne_cities_gdf.geometry.to_geopandas()
+            assert isinstance(geopandas_geoseries, geopandas.GeoSeries)
 
 
 class TestRoundTripGeoPandas:
-    def test_gdf_round_trip(self, ne_cities_gdf: gpl.GeoDataFrame):
-        geopandas_gdf = ne_cities_gdf.to_geopandas()
-        new_gdf = gpl.GeoDataFrame._from_geopandas(geopandas_gdf, force_wkb=True)
-        assert new_gdf.frame_equal(ne_cities_gdf)
-
-    def test_geoseries_round_trip(self, ne_cities_gdf: gpl.GeoDataFrame):
-        geoseries = ne_cities_gdf.geometry
-        geopandas_geoseries = geoseries.to_geopandas()
-        new_geoseries = gpl.GeoSeries._from_geopandas(
-            geopandas_geoseries, force_wkb=True
-        )
-        assert new_geoseries.series_equal(geoseries)
+    @pytest.mark.parametrize("kind", ["gdf", "geoseries"])
+    def test_wkb_round_trip(
+        self,
+        kind: str,
+        ne_cities_gdf: gpl.GeoDataFrame,
+        ne_cities_geoseries: gpl.GeoSeries,
+        ne_cities_gdf_as_geopandas,
+    ):
+        if kind == "gdf":
+            new_gdf = _roundtrip(
+                ne_cities_gdf, via=ne_cities_gdf_as_geopandas, force_wkb=True
+            )
+            _assert_equiv(new_gdf, ne_cities_gdf, gpl.GeoDataFrame)
+        else:
+            new_geoseries = _roundtrip(
+                ne_cities_geoseries,
+                via=ne_cities_gdf_as_geopandas.geometry,
+                force_wkb=True,
+            )
+            _assert_equiv(new_geoseries, ne_cities_geoseries, gpl.GeoSeries)
+
+    @pytest.mark.parametrize("kind", ["gdf", "geoseries"])
+    def test_geoarrow_round_trip(
+        self,
+        kind: str,
+        ne_cities_geopandas_gdf: geopandas.GeoDataFrame,
+        ne_cities_schema,
+    ):
+        source = ne_cities_geopandas_gdf.geometry
+        if kind == "gdf":
+            round_tripped = gpl.GeoDataFrame._from_geopandas(
+                ne_cities_geopandas_gdf, force_wkb=False, schema=ne_cities_schema
+            ).to_geopandas()
+            assert round_tripped.geom_equals(source).all()
+        else:
+            round_tripped = gpl.GeoSeries._from_geopandas(
+                source, force_wkb=False
+            ).to_geopandas()
+            assert round_tripped.geom_equals(source.reset_index(drop=True)).all()
+
+    def test_crs_round_trip(
+        self, ne_cities_geopandas_gdf: geopandas.GeoDataFrame, ne_cities_crs
+    ):
+        converted = gpl.from_geopandas(ne_cities_geopandas_gdf)
+        assert isinstance(converted, gpl.GeoDataFrame)
+        round_tripped = converted.to_geopandas()
+        assert _crs_equal(round_tripped.crs, ne_cities_crs)
+
+    def test_crs_propagates_by_reference(
+        self, ne_cities_geopandas_gdf: geopandas.GeoDataFrame
+    ):
+        # The converters carry the CRS as a plain Python reference, so the
+        # `a is b` fast path in _crs_equal settles round-trip assertions
+        # without ever parsing WKT through PROJ.
+        converted = gpl.from_geopandas(ne_cities_geopandas_gdf)
+        assert isinstance(converted, gpl.GeoDataFrame)
+        assert converted.crs is ne_cities_geopandas_gdf.crs
+        assert converted.to_geopandas().crs is ne_cities_geopandas_gdf.crs
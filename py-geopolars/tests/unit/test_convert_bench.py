@@ -0,0 +1,28 @@
+"""Benchmarks pinning the per-call cost of the geopandas converters.
+
+These do not assert correctness (test_convert.py covers that); they exist so
+conversion throughput regressions show up in CI. Run them explicitly with
+`pytest --benchmark-only`; plain test runs skip this module.
+"""
+import geopolars as gpl
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(group="convert")
+
+
+@pytest.fixture(autouse=True)
+def _benchmark_only(request):
+    # Without this gate a plain `pytest` run executes the full calibrated
+    # timing loops whenever pytest-benchmark is installed.
+    if not request.config.getoption("--benchmark-only"):
+        pytest.skip("benchmarks run only with --benchmark-only")
+
+
+def test_from_geopandas_benchmark(benchmark, ne_cities_geopandas_gdf):
+    benchmark(gpl.from_geopandas, ne_cities_geopandas_gdf)
+
+
+def test_to_geopandas_benchmark(benchmark, ne_cities_gdf):
+    benchmark(ne_cities_gdf.to_geopandas)